@@ -0,0 +1,79 @@
+"""
+Python library for data anonymization, developed to support LGPD compliance.
+
+The functions of the lib/ and utils/ modules are available directly from this
+package. Submodules are imported only when one of their functions is first
+accessed, so importing the package does not load pandas, numpy, pyarrow or
+pycryptodome.
+"""
+import importlib
+
+# Public function name -> submodule that defines it
+_EXPORTS = {
+    'encrypt_chacha20': '.lib.encryption',
+    'encrypt_aes': '.lib.encryption',
+    'encrypt_salsa20': '.lib.encryption',
+    'generalization': '.lib.generalization',
+    'age_generalize_func': '.lib.generalization',
+    'percent_generalize_func': '.lib.generalization',
+    'apply_md5': '.lib.hashing',
+    'apply_sha1': '.lib.hashing',
+    'apply_sha256': '.lib.hashing',
+    'mask_full': '.lib.masking',
+    'mask_range': '.lib.masking',
+    'mask_last_n_characters': '.lib.masking',
+    'mask_first_n_characters': '.lib.masking',
+    'mask_email': '.lib.masking',
+    'mask_cpf': '.lib.masking',
+    'drop_columns': '.lib.null_out',
+    'perturb_date': '.lib.perturbation',
+    'perturb_numeric_range': '.lib.perturbation',
+    'perturb_numeric_gaussian': '.lib.perturbation',
+    'perturb_numeric_laplacian': '.lib.perturbation',
+    'pseudonymize_columns': '.lib.pseudonymization',
+    'pseudonymize_rows': '.lib.pseudonymization',
+    'swap_columns': '.lib.swapping',
+    'swap_rows': '.lib.swapping',
+    'csv_to_table': '.utils.arrow_io',
+    'parquet_to_table': '.utils.arrow_io',
+    'table_to_csv': '.utils.arrow_io',
+    'table_to_parquet': '.utils.arrow_io',
+    'get_backend': '.utils.backends',
+    'apply_operation': '.utils.backends',
+    'value_to_dataframe': '.utils.data_processing',
+    'csv_to_dataframe': '.utils.data_processing',
+    'convert_to_string': '.utils.data_processing',
+    'convert_to_numeric': '.utils.data_processing',
+    'convert_to_datetime': '.utils.data_processing',
+    'convert_to_bool': '.utils.data_processing',
+    'check_columns': '.utils.data_processing',
+    'run_partitioned': '.utils.parallel_processing',
+    'profile_columns': '.utils.profiling'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """
+    Imports the submodule defining the requested function on first access.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        function: The requested function.
+
+    Raises:
+        AttributeError: If the package has no such attribute.
+    """
+    if name not in _EXPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value  # Cache the function so __getattr__ is not called again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,4 @@
+from anonymizer_lib.cli import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+import argparse
+import importlib
+import json
+import os
+import threading
+
+import anonymizer_lib
+from anonymizer_lib.utils.backends import OPERATIONS, apply_operation
+
+# Function reading each file format, for each backend accepted in a job spec.
+READERS = {
+    ('pandas', '.csv'): ('anonymizer_lib.utils.data_processing', 'csv_to_dataframe'),
+    ('pandas', '.parquet'): ('pandas', 'read_parquet'),
+    ('arrow', '.csv'): ('anonymizer_lib.utils.arrow_io', 'csv_to_table'),
+    ('arrow', '.parquet'): ('anonymizer_lib.utils.arrow_io', 'parquet_to_table')
+}
+
+# Operations accepted for each backend. pandas jobs may use every lib/ function;
+# arrow jobs only those with an Arrow implementation.
+BACKEND_OPERATIONS = {
+    'pandas': {name for name, module in anonymizer_lib._EXPORTS.items() if module.startswith('.lib.')},
+    'arrow': set(OPERATIONS)
+}
+
+
+def load_spec(spec_file):
+    """
+    Loads a job spec from a JSON or YAML file.
+
+    A spec is either a single job or a mapping with a 'jobs' list. Each job has an
+    'input' file, an 'output' file, an optional 'backend' ('pandas' or 'arrow',
+    defaults to 'pandas') and a list of 'operations', each with an 'operation'
+    name and its 'args' (the arguments between the data and the semaphore).
+
+    Args:
+        spec_file (str): The path to the spec file (.json, .yaml or .yml).
+
+    Returns:
+        list: The jobs described in the spec.
+
+    Raises:
+        ValueError: If the spec file format is not supported.
+    """
+    extension = os.path.splitext(spec_file)[1].lower()
+
+    with open(spec_file, encoding='utf-8') as file:
+        if extension == '.json':
+            spec = json.load(file)
+        elif extension in ('.yaml', '.yml'):
+            import yaml  # PyYAML is only needed for YAML specs
+            spec = yaml.safe_load(file)
+        else:
+            raise ValueError(f"Unsupported spec format: {extension}")
+
+    return spec['jobs'] if 'jobs' in spec else [spec]
+
+
+def _load_function(module_name, function_name):
+    """
+    Imports a function from a module.
+
+    Args:
+        module_name (str): The name of the module.
+        function_name (str): The name of the function.
+
+    Returns:
+        function: The requested function.
+    """
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _file_extension(backend, path):
+    """
+    Identifies the extension of a data file, checking that the backend supports it.
+
+    Args:
+        backend (str): The backend of the job.
+        path (str): The path to the data file.
+
+    Returns:
+        str: The extension of the file.
+
+    Raises:
+        ValueError: If the backend or the file format is not supported.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if (backend, extension) not in READERS:
+        raise ValueError(f"Unsupported backend or file format: {backend}, {extension}")
+    return extension
+
+
+def _resolve_args(operation, args):
+    """
+    Resolves arguments that can't be written in a spec file.
+
+    The generalization function is given by the name of a function of lib/generalization.
+
+    Args:
+        operation (str): The name of the operation.
+        args (list): The arguments read from the spec.
+
+    Returns:
+        list: The arguments to be passed to the operation.
+    """
+    if operation == 'generalization' and isinstance(args[1], str):
+        args = [args[0], _load_function('anonymizer_lib.lib.generalization', args[1])] + list(args[2:])
+    return args
+
+
+def run_job(job, semaphore):
+    """
+    Reads the input file of a job, applies its operations in order and writes the output file.
+
+    Args:
+        job (dict): The job, as described in load_spec.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the data.
+
+    Raises:
+        ValueError: If an operation, the backend or a file format is not supported.
+    """
+    backend = job.get('backend', 'pandas')
+    input_extension = _file_extension(backend, job['input'])
+    output_extension = _file_extension(backend, job['output'])
+
+    for step in job['operations']:
+        if step['operation'] not in BACKEND_OPERATIONS[backend]:
+            raise ValueError(f"Unsupported operation for the {backend} backend: {step['operation']}")
+
+    data = _load_function(*READERS[(backend, input_extension)])(job['input'])
+
+    for step in job['operations']:
+        args = _resolve_args(step['operation'], step.get('args', []))
+        if backend == 'pandas':
+            result = getattr(anonymizer_lib, step['operation'])(data, *args, semaphore)
+            # Most pandas operations modify the DataFrame in place and return None
+            data = data if result is None else result
+        else:
+            data = apply_operation(data, step['operation'], *args, semaphore=semaphore)
+
+    if backend == 'arrow':
+        writer = 'table_to_csv' if output_extension == '.csv' else 'table_to_parquet'
+        _load_function('anonymizer_lib.utils.arrow_io', writer)(data, job['output'])
+    elif output_extension == '.csv':
+        data.to_csv(job['output'], index=False)
+    else:
+        data.to_parquet(job['output'], index=False)
+
+
+def main(argv=None):
+    """
+    Command line entry point: runs every job of a spec file in a single process.
+
+    Args:
+        argv (list): Command line arguments. Defaults to sys.argv[1:].
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m anonymizer_lib',
+        description='Runs the anonymization jobs described in a JSON or YAML spec file.'
+    )
+    parser.add_argument('spec', help='Path to the job spec file (.json, .yaml or .yml).')
+    args = parser.parse_args(argv)
+
+    semaphore = threading.Semaphore()
+    for job in load_spec(args.spec):
+        run_job(job, semaphore)
@@ -0,0 +1,3 @@
+"""
+Anonymization techniques. Each submodule is imported only when used.
+"""
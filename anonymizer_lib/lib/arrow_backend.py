@@ -0,0 +1,510 @@
+import hashlib
+import re
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Arrow implementations of the operations in lib/. Each function mirrors the
+# pandas version with the same name, but receives a pyarrow.Table and, since
+# Arrow tables are immutable, returns the modified table.
+
+TIME_UNITS = {
+    'days': 'D',
+    'hours': 'h',
+    'minutes': 'm',
+    'seconds': 's',
+    'milliseconds': 'ms',
+    'microseconds': 'us',
+    'nanoseconds': 'ns'
+}
+
+
+def _set_column(table, column, values):
+    """
+    Replaces a column of the table, keeping its position.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        column (str): The name of the column to be replaced.
+        values (pyarrow.Array or pyarrow.ChunkedArray): The new values of the column.
+
+    Returns:
+        pyarrow.Table: The table with the replaced column.
+    """
+    return table.set_column(table.schema.get_field_index(column), column, values)
+
+
+def _as_string(values):
+    """
+    Casts a column to string, as required by the string kernels.
+
+    Args:
+        values (pyarrow.ChunkedArray): The input column.
+
+    Returns:
+        pyarrow.ChunkedArray: The column as a string column.
+    """
+    if pa.types.is_string(values.type):
+        return values
+    return pc.cast(values, pa.string())
+
+
+def _apply_hash(table, columns, hash_func, semaphore):
+    """
+    Applies a hashlib hash function to the specified columns of a table.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        columns (list): Name of the column(s) to apply the hash.
+        hash_func (function): The hashlib constructor (e.g. hashlib.md5).
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The table with the hashed columns.
+    """
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    for column in columns:
+        # Arrow has no cryptographic hash kernels; hash str(x) as the pandas version does. Missing
+        # values are hashed as 'nan', the representation pandas gives them when reading a file.
+        hashed = [
+            hash_func(('nan' if value is None else str(value)).encode()).hexdigest()
+            for value in table[column].to_pylist()
+        ]
+        table = _set_column(table, column, pa.array(hashed, pa.string()))
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def apply_md5(table, columns, semaphore):
+    """
+    Applies the MD5 hash function to the specified columns of a table.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        columns (list): Name of the column(s) to apply the MD5 hash.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The table with the hashed columns.
+    """
+    return _apply_hash(table, columns, hashlib.md5, semaphore)
+
+
+def apply_sha1(table, columns, semaphore):
+    """
+    Applies the SHA1 hash function to the specified columns of a table.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        columns (list): Name of the column(s) to apply the SHA1 hash.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The table with the hashed columns.
+    """
+    return _apply_hash(table, columns, hashlib.sha1, semaphore)
+
+
+def apply_sha256(table, columns, semaphore):
+    """
+    Applies the SHA256 hash function to the specified columns of a table.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        columns (list): Name of the column(s) to apply the SHA256 hash.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The table with the hashed columns.
+    """
+    return _apply_hash(table, columns, hashlib.sha256, semaphore)
+
+
+def mask_full(table, column_names, semaphore):
+    """
+    Applies the '*' mask to the missing values of all specified columns.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        column_names (list): A list of column names to apply the mask to.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The masked table.
+    """
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    for column in column_names:
+        if table[column].null_count > 0:
+            table = _set_column(table, column, pc.fill_null(_as_string(table[column]), '*'))
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def mask_range(table, column_names, start_index, end_index, semaphore):
+    """
+    Applies the '*' mask to a range of characters in each specified column.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        column_names (list): A list of column names to apply the mask to.
+        start_index (int): The starting index of the range (inclusive).
+        end_index (int): The ending index of the range (exclusive).
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The masked table.
+    """
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    for column in column_names:
+        values = _as_string(table[column])
+        lengths = pc.utf8_length(values)
+        masked_lengths = pc.max_element_wise(pc.subtract(pc.min_element_wise(lengths, end_index), start_index), 0)
+        masked = pc.binary_join_element_wise(
+            pc.utf8_slice_codeunits(values, 0, start_index),
+            pc.binary_repeat('*', masked_lengths),
+            pc.utf8_slice_codeunits(values, end_index),
+            ''
+        )
+        table = _set_column(table, column, masked)
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def mask_last_n_characters(table, column_names, n, semaphore):
+    """
+    Applies the '*' mask to the last N characters of each specified column.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        column_names (list): A list of column names to apply the mask to.
+        n (int): The number of characters to mask from the end of each value.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The masked table.
+    """
+    if n <= 0:
+        return table  # Nothing to mask; slicing up to -0 would blank every value
+
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    for column in column_names:
+        values = _as_string(table[column])
+        masked = pc.binary_join_element_wise(pc.utf8_slice_codeunits(values, 0, -n), '*' * n, '')
+        table = _set_column(table, column, pc.if_else(pc.greater(pc.utf8_length(values), n), masked, values))
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def mask_first_n_characters(table, column_names, n, semaphore):
+    """
+    Applies the '*' mask to the first N characters of each specified column.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        column_names (list): A list of column names to apply the mask to.
+        n (int): The number of characters to mask from the beginning of each value.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The masked table.
+    """
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    for column in column_names:
+        values = _as_string(table[column])
+        masked = pc.binary_join_element_wise('*' * n, pc.utf8_slice_codeunits(values, n), '')
+        table = _set_column(table, column, pc.if_else(pc.greater(pc.utf8_length(values), n), masked, values))
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def mask_email(table, column_names, semaphore):
+    """
+    Replaces each value of the specified columns with its email domain, or with 'email.com' if it's not a valid email.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        column_names (list): A list of column names to apply the mask to.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The masked table.
+    """
+    pattern = re.compile(r"@(?P<domain>[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)")
+
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    for column in column_names:
+        domains = pc.struct_field(pc.extract_regex(_as_string(table[column]), pattern.pattern), [0])
+        table = _set_column(table, column, pc.fill_null(domains, 'email.com'))
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def mask_cpf(table, cpf_column, semaphore):
+    """
+    Applies the mask to CPFs, keeping only the first 3 digits and the last 2 digits visible.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        cpf_column (str): The name of the column containing CPF values.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The masked table.
+    """
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    values = _as_string(table[cpf_column])
+    lengths = pc.utf8_length(values)
+    masked = pc.if_else(
+        pc.greater(lengths, 5),
+        pc.binary_join_element_wise(
+            pc.utf8_slice_codeunits(values, 0, 3),
+            pc.binary_repeat('*', pc.max_element_wise(pc.subtract(lengths, 5), 0)),
+            pc.utf8_slice_codeunits(values, -2),
+            ''
+        ),
+        pc.binary_repeat('*', lengths)
+    )
+    formatted = pc.binary_join_element_wise(
+        pc.utf8_slice_codeunits(masked, 0, 3), '.',
+        pc.utf8_slice_codeunits(masked, 3, 6), '.',
+        pc.utf8_slice_codeunits(masked, 6, 9), '-',
+        pc.utf8_slice_codeunits(masked, 9),
+        ''
+    )
+    table = _set_column(table, cpf_column, formatted)
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def swap_columns(table, columns, semaphore):
+    """
+    Swaps the values in the specified columns of the table.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        columns (list): Name of the column(s) to be swapped.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The table with the swapped columns.
+    """
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    for column in columns:
+        table = _set_column(table, column, table[column].take(np.random.permutation(table.num_rows)))
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def swap_rows(table, columns, semaphore):
+    """
+    Swaps the rows of the table based on the values in the specified columns.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        columns (list): Name of the column(s) to be used for row swapping.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The table with the swapped rows.
+    """
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    # The same permutation is applied to all columns so the values of a row stay together
+    permutation = np.random.permutation(table.num_rows)
+    for column in columns:
+        table = _set_column(table, column, table[column].take(permutation))
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def perturb_date(table, columns, unit, min_val, max_val, semaphore):
+    """
+    Applies a date perturbation technique to specific columns of the table.
+
+    Args:
+    - table: pyarrow Table.
+    - columns: List of columns where the perturbation will be applied.
+    - unit: Unit of time to be added/subtracted (e.g., 'days', 'hours', 'minutes').
+    - min_val: Minimum number of units to be added/subtracted.
+    - max_val: Maximum number of units to be added/subtracted.
+    - semaphore: threading.Semaphore to synchronize access to the table.
+
+    Returns:
+    - The perturbed pyarrow Table.
+    """
+
+    if unit not in TIME_UNITS:
+        raise ValueError(f"Unsupported unit: {unit}")
+
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    for column in columns:
+        original_type = table.schema.field(column).type
+        values = table[column]
+        # Dates are shifted as timestamps in seconds; timestamps keep their own unit
+        column_unit = original_type.unit if pa.types.is_timestamp(original_type) else 's'
+        if pa.types.is_date(original_type):
+            values = pc.cast(values, pa.timestamp(column_unit))
+
+        offsets = np.random.randint(min_val, max_val + 1, size=table.num_rows) * np.timedelta64(1, TIME_UNITS[unit])
+        offsets = pa.array(offsets.astype(f'timedelta64[{column_unit}]'), pa.duration(column_unit))
+        perturbed = pc.cast(pc.add(values, offsets), original_type, safe=False)
+        table = _set_column(table, column, perturbed)
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def _perturb_numeric(table, columns, integer_noise, float_noise, semaphore):
+    """
+    Adds noise to specific numeric columns of the table.
+
+    Args:
+    - table: pyarrow Table.
+    - columns: List of columns where the perturbation will be applied.
+    - integer_noise: Function returning the noise for an integer column, given its size.
+    - float_noise: Function returning the noise for a float column, given its size.
+    - semaphore: threading.Semaphore to synchronize access to the table.
+
+    Returns:
+    - The perturbed pyarrow Table.
+    """
+
+    for column in columns:
+        column_type = table.schema.field(column).type
+        if not (pa.types.is_integer(column_type) or pa.types.is_floating(column_type)):
+            raise ValueError(f"Column '{column}' is not of type int or float.")
+
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    for column in columns:
+        original_values = table[column]
+
+        # Check the column type (int or float) and perturb the values
+        if pa.types.is_integer(original_values.type):
+            noise = integer_noise(table.num_rows)
+        else:
+            noise = float_noise(table.num_rows)
+
+        table = _set_column(table, column, pc.add(original_values, pa.array(noise)))
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def perturb_numeric_range(table, columns, perturbation_range, semaphore):
+    """
+    Applies a numeric perturbation technique to specific columns of the table.
+
+    Args:
+    - table: pyarrow Table.
+    - columns: List of columns where the perturbation will be applied.
+    - perturbation_range: Range of perturbation values as a tuple (min_val, max_val).
+    - semaphore: threading.Semaphore to synchronize access to the table.
+
+    Returns:
+    - The perturbed pyarrow Table.
+    """
+    return _perturb_numeric(
+        table, columns,
+        lambda size: np.random.randint(*perturbation_range, size=size),
+        lambda size: np.random.uniform(*perturbation_range, size=size),
+        semaphore
+    )
+
+
+def perturb_numeric_gaussian(table, columns, perturbation_std, semaphore):
+    """
+    Applies a Gaussian perturbation technique to specific columns of the table.
+
+    Args:
+    - table: pyarrow Table.
+    - columns: List of columns where the perturbation will be applied.
+    - perturbation_std: Standard deviation of the Gaussian perturbation.
+    - semaphore: threading.Semaphore to synchronize access to the table.
+
+    Returns:
+    - The perturbed pyarrow Table.
+    """
+    return _perturb_numeric(
+        table, columns,
+        lambda size: np.random.normal(scale=perturbation_std, size=size).astype(int),
+        lambda size: np.random.normal(scale=perturbation_std, size=size),
+        semaphore
+    )
+
+
+def perturb_numeric_laplacian(table, columns, perturbation_value, semaphore):
+    """
+    Applies a Laplacian perturbation technique to specific columns of the table.
+
+    Args:
+    - table: pyarrow Table.
+    - columns: List of columns where the perturbation will be applied.
+    - perturbation_value: Perturbation value.
+    - semaphore: threading.Semaphore to synchronize access to the table.
+
+    Returns:
+    - The perturbed pyarrow Table.
+    """
+    def laplace_noise(size):
+        return np.random.laplace(scale=perturbation_value/np.sqrt(2), size=size)
+
+    return _perturb_numeric(table, columns, laplace_noise, laplace_noise, semaphore)
+
+
+def generalization(table, column_names, generalize_func, semaphore):
+    """
+    Applies a generalization technique to one or more columns of a table.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        column_names (str or list): Name of the column(s) to be generalized.
+        generalize_func (function): Generalization function to be applied to the column(s).
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The generalized table.
+    """
+
+    # Convert the column name(s) to a list if it's a string
+    if isinstance(column_names, str):
+        column_names = [column_names]
+
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    for column in column_names:
+        # Missing values are kept missing instead of being passed to generalize_func
+        generalized = [None if value is None else generalize_func(value) for value in table[column].to_pylist()]
+        table = _set_column(table, column, pa.array(generalized))
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
+
+
+def drop_columns(table, columns, semaphore):
+    """
+    Drops the specified columns from a table.
+
+    Args:
+        table (pyarrow.Table): The input table.
+        columns (str or list): Name of the column(s) to be dropped.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the table.
+
+    Returns:
+        pyarrow.Table: The table without the dropped columns.
+    """
+    if isinstance(columns, str):
+        columns = [columns]
+
+    semaphore.acquire()  # Acquire the semaphore before modifying the table
+    table = table.select([name for name in table.column_names if name not in columns])
+    semaphore.release()  # Release the semaphore after modifying the table
+
+    return table
@@ -0,0 +1,3 @@
+"""
+Data conversion, backend dispatch and parallel execution helpers. Each submodule is imported only when used.
+"""
@@ -0,0 +1,49 @@
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+def csv_to_table(csv_file):
+    """
+    Converts a CSV file into a pyarrow Table, without going through pandas.
+
+    Args:
+        csv_file (str): The path to the CSV file.
+
+    Returns:
+        pyarrow.Table: The converted Table.
+    """
+    # Empty fields are read as missing values, as pandas.read_csv does
+    table = pa_csv.read_csv(csv_file, convert_options=pa_csv.ConvertOptions(strings_can_be_null=True))
+    return table
+
+def parquet_to_table(parquet_file):
+    """
+    Converts a Parquet file into a pyarrow Table, without going through pandas.
+
+    Args:
+        parquet_file (str): The path to the Parquet file.
+
+    Returns:
+        pyarrow.Table: The converted Table.
+    """
+    table = pq.read_table(parquet_file)
+    return table
+
+def table_to_csv(table, csv_file):
+    """
+    Writes a pyarrow Table to a CSV file.
+
+    Args:
+        table (pyarrow.Table): The Table to be written.
+        csv_file (str): The path to the CSV file.
+    """
+    pa_csv.write_csv(table, csv_file)
+
+def table_to_parquet(table, parquet_file):
+    """
+    Writes a pyarrow Table to a Parquet file.
+
+    Args:
+        table (pyarrow.Table): The Table to be written.
+        parquet_file (str): The path to the Parquet file.
+    """
+    pq.write_table(table, parquet_file)
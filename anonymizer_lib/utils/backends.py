@@ -0,0 +1,94 @@
+import importlib
+import sys
+
+# Operations available on every backend, with the lib/ module holding their pandas
+# implementation. The Arrow implementations, with the same names, live in
+# lib/arrow_backend. Modules are imported only when an operation is applied.
+OPERATIONS = {
+    'apply_md5': 'hashing',
+    'apply_sha1': 'hashing',
+    'apply_sha256': 'hashing',
+    'mask_full': 'masking',
+    'mask_range': 'masking',
+    'mask_last_n_characters': 'masking',
+    'mask_first_n_characters': 'masking',
+    'mask_email': 'masking',
+    'mask_cpf': 'masking',
+    'swap_columns': 'swapping',
+    'swap_rows': 'swapping',
+    'perturb_date': 'perturbation',
+    'perturb_numeric_range': 'perturbation',
+    'perturb_numeric_gaussian': 'perturbation',
+    'perturb_numeric_laplacian': 'perturbation',
+    'generalization': 'generalization',
+    'drop_columns': 'null_out'
+}
+
+
+def get_backend(data):
+    """
+    Identifies the backend able to process the given data.
+
+    Args:
+        data (pandas.DataFrame, pyarrow.Table or polars.DataFrame): The input data.
+
+    Returns:
+        str: 'pandas', 'arrow' or 'polars'.
+
+    Raises:
+        TypeError: If the data type is not supported.
+    """
+    # A library that was never imported cannot have produced the data, so the
+    # type checks below do not force pandas, pyarrow or polars to be loaded.
+    pandas = sys.modules.get('pandas')
+    if pandas is not None and isinstance(data, pandas.DataFrame):
+        return 'pandas'
+
+    pyarrow = sys.modules.get('pyarrow')
+    if pyarrow is not None and isinstance(data, pyarrow.Table):
+        return 'arrow'
+
+    polars = sys.modules.get('polars')
+    if polars is not None and isinstance(data, polars.DataFrame):
+        return 'polars'
+
+    raise TypeError(f"Unsupported data type: {type(data).__name__}")
+
+
+def apply_operation(data, operation, *args, semaphore):
+    """
+    Applies an operation of the library using the backend that matches the data type.
+
+    pandas DataFrames are processed by the lib/ modules. pyarrow Tables are processed
+    natively with Arrow compute kernels, and Polars DataFrames are processed as Arrow
+    tables without being converted to pandas.
+
+    Args:
+        data (pandas.DataFrame, pyarrow.Table or polars.DataFrame): The input data.
+        operation (str): Name of the operation (e.g. 'apply_sha256', 'mask_cpf').
+        *args: Arguments of the operation, between the data and the semaphore.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the data.
+
+    Returns:
+        The data resulting from the operation, of the same type as the input.
+
+    Raises:
+        ValueError: If the operation is not supported.
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unsupported operation: {operation}")
+
+    backend = get_backend(data)
+
+    if backend == 'pandas':
+        module = importlib.import_module(f'anonymizer_lib.lib.{OPERATIONS[operation]}')
+        result = getattr(module, operation)(data, *args, semaphore)
+        # Most pandas operations modify the DataFrame in place and return None
+        return data if result is None else result
+
+    arrow_operation = getattr(importlib.import_module('anonymizer_lib.lib.arrow_backend'), operation)
+    if backend == 'arrow':
+        return arrow_operation(data, *args, semaphore)
+
+    polars = sys.modules['polars']
+    return polars.from_arrow(arrow_operation(data.to_arrow(), *args, semaphore))
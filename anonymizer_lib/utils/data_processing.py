@@ -90,8 +90,14 @@ def check_columns(df, semaphore):
         ValueError: If there are any columns where all fields are NaN or NaT.
     """
     semaphore.acquire()  # Acquire the semaphore before accessing the DataFrame
-    nan_columns = df.columns[df.isnull().all()]
+    # Check column by column (by position, so duplicate names are all checked) instead of
+    # building a boolean copy of the whole DataFrame; a column whose first value is present
+    # is not scanned at all
+    nan_columns = [
+        df.columns[position] for position in range(df.shape[1])
+        if not df.iloc[:1, position].notna().any() and not df.iloc[:, position].notna().any()
+    ]
     semaphore.release()  # Release the semaphore after accessing the DataFrame
 
     if len(nan_columns) > 0:
-        raise ValueError(f"There are columns where all fields are NaN or NaT: {nan_columns.tolist()}")
\ No newline at end of file
+        raise ValueError(f"There are columns where all fields are NaN or NaT: {nan_columns}")
\ No newline at end of file
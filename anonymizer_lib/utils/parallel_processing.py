@@ -0,0 +1,297 @@
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Operations that depend on the whole column (swapping), on a random state that
+# would be duplicated in every forked worker (perturbation) or on a nonce and
+# keystream running across all rows (encryption) cannot be applied partition
+# by partition.
+NON_PARTITIONABLE_MODULES = (
+    'anonymizer_lib.lib.swapping',
+    'anonymizer_lib.lib.perturbation',
+    'anonymizer_lib.lib.encryption'
+)
+
+# Worker-side cache of attached shared memory blocks, keyed by block name.
+_attached_blocks = {}
+
+
+def run_partitioned(df, func, args=(), n_partitions=None, max_workers=None):
+    """
+    Applies a row-wise operation of the library to a DataFrame using several processes.
+
+    The DataFrame is split into row partitions. Numeric and datetime columns, as well as
+    string columns (as Arrow buffers), are placed in shared memory so that the workers
+    read their partition without the input being copied to them. The partial results are
+    reassembled in the original row order.
+
+    Args:
+        df (pandas.DataFrame): The input DataFrame.
+        func (function): Operation with the signature func(df, *args, semaphore), such as
+            apply_sha256, pseudonymize_columns or mask_email. func and args must be picklable,
+            so functions such as generalize_func must be defined at module level.
+        args (tuple): Positional arguments passed to func between the DataFrame and the semaphore.
+        n_partitions (int): Number of row partitions. Defaults to the number of workers.
+        max_workers (int): Maximum number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        pandas.DataFrame: The DataFrame resulting from the operation.
+
+    Raises:
+        ValueError: If func cannot be applied to row partitions independently.
+    """
+    if getattr(func, '__module__', None) in NON_PARTITIONABLE_MODULES:
+        raise ValueError(f"Operation '{func.__name__}' cannot be applied to row partitions.")
+
+    n_rows = len(df)
+    if n_partitions is None:
+        n_partitions = max_workers or os.cpu_count() or 1
+    n_partitions = max(1, min(n_partitions, n_rows))
+    bounds = np.linspace(0, n_rows, n_partitions + 1).astype(int)
+
+    blocks = []
+    restored_dtypes = {}
+    try:
+        columns = []
+        for position in range(df.shape[1]):
+            column = df.iloc[:, position]
+            if _is_nullable_numeric(column.dtype):
+                # Operations see a nullable column as the numpy array of the whole column (float
+                # with NaN if it has missing values), so every partition gets that same array.
+                values = column.to_numpy()
+                restored_dtypes[column.name] = (column.dtype, values.dtype)
+                column = pd.Series(values, index=column.index, name=column.name)
+            columns.append(_share_column(column, blocks))
+        index = _share_index(df.index)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_partition, _slice_by_value(columns, start, stop), _slice_by_value([index], start, stop)[0],
+                    df.columns, start, stop, func, args
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            results = [pickle.loads(future.result()) for future in futures]
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    result = pd.concat(results)
+
+    # Columns left as shared by the operation get their nullable dtype back
+    for name, (original_dtype, shared_dtype) in restored_dtypes.items():
+        if name in result.columns and isinstance(result[name], pd.Series) and result[name].dtype == shared_dtype:
+            try:
+                result[name] = result[name].astype(original_dtype)
+            except (TypeError, ValueError):
+                pass
+
+    return result
+
+
+def _is_nullable_numeric(dtype):
+    """
+    Checks if a dtype is a pandas nullable numeric or boolean dtype (e.g. Int64, Float64, boolean).
+
+    Args:
+        dtype: The dtype of the column.
+
+    Returns:
+        bool: True if the dtype is a nullable numeric or boolean extension dtype.
+    """
+    return not isinstance(dtype, (np.dtype, pd.StringDtype)) and dtype.kind in 'biuf'
+
+
+def _share_column(column, blocks):
+    """
+    Describes a column so that a worker can rebuild any slice of it.
+
+    Numeric and datetime columns are copied once into a shared memory block. Columns of
+    str values are converted to an Arrow large_string array whose buffers are copied into
+    shared memory blocks. Any other column is sent to the workers by value.
+
+    Args:
+        column (pandas.Series): The column to be shared.
+        blocks (list): List where the created shared memory blocks are appended.
+
+    Returns:
+        tuple: The column description.
+    """
+    dtype = column.dtype
+
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM':
+        values = np.ascontiguousarray(column.to_numpy())
+        name = _copy_to_shared_memory(values.view(np.uint8), blocks)
+        return ('numpy', name, values.dtype.str, len(values))
+
+    # Only columns holding str values go through Arrow; bytes (e.g. after encrypt_aes)
+    # or mixed values would come back as str, so they are sent by value instead.
+    if isinstance(dtype, pd.StringDtype) or (
+        dtype == object and pd.api.types.infer_dtype(column, skipna=True) == 'string'
+    ):
+        # Keep the original missing-value marker (None or NaN) so that operations such
+        # as str(x) produce the same output as when applied to the whole DataFrame.
+        missing = column[column.isna()]
+        if len({type(value) for value in missing}) > 1:
+            return ('pickle', column)
+        null_value = missing.iloc[0] if len(missing) > 0 else None
+
+        array = pa.array(column, type=pa.large_string(), from_pandas=True)
+        names = [
+            None if buffer is None else _copy_to_shared_memory(np.frombuffer(buffer, dtype=np.uint8), blocks)
+            for buffer in array.buffers()
+        ]
+        return ('arrow', names, len(array), array.null_count, dtype, null_value)
+
+    return ('pickle', column)
+
+
+def _share_index(index):
+    """
+    Describes the index of the DataFrame so that a worker can rebuild any slice of it.
+
+    Args:
+        index (pandas.Index): The index to be shared.
+
+    Returns:
+        tuple: The index description.
+    """
+    if isinstance(index, pd.RangeIndex):
+        return ('range', index.start, index.step, index.name)
+    return ('pickle', index)
+
+
+def _slice_by_value(descriptions, start, stop):
+    """
+    Restricts the descriptions sent by value to the rows [start, stop) of a partition.
+
+    Args:
+        descriptions (list): Column or index descriptions.
+        start (int): The first row of the partition (inclusive).
+        stop (int): The last row of the partition (exclusive).
+
+    Returns:
+        list: The descriptions, with the values sent by value sliced to the partition.
+    """
+    sliced = []
+    for description in descriptions:
+        if description[0] == 'pickle':
+            values = description[1]
+            values = values.iloc[start:stop] if isinstance(values, pd.Series) else values[start:stop]
+            description = ('pickle', values)
+        sliced.append(description)
+    return sliced
+
+
+def _copy_to_shared_memory(buffer, blocks):
+    """
+    Copies a buffer into a new shared memory block.
+
+    Args:
+        buffer (numpy.ndarray): The bytes to be copied, as a uint8 array.
+        blocks (list): List where the created shared memory block is appended.
+
+    Returns:
+        str: The name of the shared memory block.
+    """
+    block = shared_memory.SharedMemory(create=True, size=max(buffer.nbytes, 1))
+    blocks.append(block)
+    np.ndarray((buffer.nbytes,), dtype=np.uint8, buffer=block.buf)[:] = buffer
+    return block.name
+
+
+def _attach(name):
+    """
+    Attaches the worker process to a shared memory block created by the parent process.
+
+    Args:
+        name (str): The name of the shared memory block.
+
+    Returns:
+        multiprocessing.shared_memory.SharedMemory: The attached block.
+    """
+    if name not in _attached_blocks:
+        # The workers share the resource tracker of the parent process, which
+        # owns the block and unlinks it once all partitions are done.
+        _attached_blocks[name] = shared_memory.SharedMemory(name=name)
+    return _attached_blocks[name]
+
+
+def _rebuild_column(description, start, stop, index):
+    """
+    Rebuilds the rows [start, stop) of a column shared with _share_column.
+
+    Args:
+        description (tuple): The column description.
+        start (int): The first row of the partition (inclusive).
+        stop (int): The last row of the partition (exclusive).
+        index (pandas.Index): The index of the partition.
+
+    Returns:
+        pandas.Series: The values of the partition.
+    """
+    kind = description[0]
+
+    if kind == 'numpy':
+        _, name, dtype, length = description
+        values = np.ndarray((length,), dtype=np.dtype(dtype), buffer=_attach(name).buf)
+        return pd.Series(values[start:stop], index=index, copy=False)
+
+    if kind == 'arrow':
+        _, names, length, null_count, dtype, null_value = description
+        buffers = [None if name is None else pa.py_buffer(_attach(name).buf) for name in names]
+        array = pa.Array.from_buffers(pa.large_string(), length, buffers, null_count)
+        values = array.slice(start, stop - start).to_numpy(zero_copy_only=False)
+        if null_value is not None:
+            values[pd.isna(values)] = null_value
+        return pd.Series(values, index=index, dtype=dtype)
+
+    return description[1].set_axis(index)
+
+
+def _run_partition(columns, index, column_names, start, stop, func, args):
+    """
+    Applies the operation to a row partition in a worker process.
+
+    Args:
+        columns (list): The column descriptions.
+        index (tuple): The index description.
+        column_names (pandas.Index): The column names of the DataFrame.
+        start (int): The first row of the partition (inclusive).
+        stop (int): The last row of the partition (exclusive).
+        func (function): The operation to be applied.
+        args (tuple): Positional arguments passed to func.
+
+    Returns:
+        bytes: The pickled DataFrame resulting from the operation.
+    """
+    if index[0] == 'range':
+        _, index_start, index_step, index_name = index
+        partition_index = pd.RangeIndex(
+            index_start + start * index_step, index_start + stop * index_step, index_step, name=index_name
+        )
+    else:
+        partition_index = index[1]
+
+    partition = pd.DataFrame(
+        {position: _rebuild_column(description, start, stop, partition_index)
+         for position, description in enumerate(columns)},
+        index=partition_index,
+    )
+    partition.columns = column_names
+
+    semaphore = threading.Semaphore()
+    result = func(partition, *args, semaphore)
+    if result is None:
+        result = partition
+
+    # Serialize here so that no view of the shared memory outlives the partition.
+    return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
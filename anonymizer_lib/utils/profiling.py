@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+
+
+def profile_columns(df, semaphore, chunk_size=100000, precision=12):
+    """
+    Computes the statistics of every column of the DataFrame in a single pass, chunk by chunk.
+
+    For each column, the profile contains:
+    - column: The name of the column.
+    - dtype: The dtype of the column, as a string.
+    - numeric: Whether the column is of type int or float.
+    - count, null_count, null_rate: Number of rows, of missing values and their rate.
+    - all_null: Whether all fields of the column are NaN or NaT.
+    - distinct: Approximate number of distinct non-null values (HyperLogLog).
+    - min, max: Minimum and maximum of numeric, boolean and datetime columns (None otherwise).
+    - min_length, max_length, length_histogram: Minimum and maximum length of the string
+      values and the number of values of each length (string columns only, None otherwise).
+
+    Args:
+        df (pandas.DataFrame): The DataFrame to be profiled.
+        semaphore (threading.Semaphore): Semaphore to synchronize access to the DataFrame.
+        chunk_size (int): Number of rows read at a time.
+        precision (int): HyperLogLog precision; uses 2**precision registers per column,
+            with a relative error of about 1.04 / sqrt(2**precision).
+
+    Returns:
+        list: The profile of each column, in column order (so duplicate column names are kept).
+    """
+    accumulators = [_new_accumulator(df.dtypes.iloc[position], precision) for position in range(df.shape[1])]
+
+    semaphore.acquire()  # Acquire the semaphore before accessing the DataFrame
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        for position, accumulator in enumerate(accumulators):
+            _update_accumulator(accumulator, chunk.iloc[:, position], precision)
+    semaphore.release()  # Release the semaphore after accessing the DataFrame
+
+    return [
+        {'column': column, **_finish_accumulator(accumulator, len(df))}
+        for column, accumulator in zip(df.columns, accumulators)
+    ]
+
+
+def _new_accumulator(dtype, precision):
+    """
+    Creates the running statistics of a column.
+
+    Args:
+        dtype: The dtype of the column.
+        precision (int): HyperLogLog precision.
+
+    Returns:
+        dict: The empty running statistics.
+    """
+    is_string = dtype == object or isinstance(dtype, pd.StringDtype)
+    # Same int/float check as perturb_numeric_*
+    numeric = isinstance(dtype, np.dtype) and (np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.floating))
+    ordered = not is_string and (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype))
+    return {
+        'dtype': dtype,
+        'numeric': numeric,
+        'ordered': ordered,
+        'is_string': is_string,
+        'null_count': 0,
+        'registers': np.zeros(2 ** precision, dtype=np.uint8),
+        'min': None,
+        'max': None,
+        'lengths': np.zeros(0, dtype=np.int64)
+    }
+
+
+def _update_accumulator(accumulator, values, precision):
+    """
+    Updates the running statistics of a column with a chunk of its values.
+
+    Args:
+        accumulator (dict): The running statistics of the column.
+        values (pandas.Series): The values of the chunk.
+        precision (int): HyperLogLog precision.
+    """
+    present = values[values.notna()]
+    accumulator['null_count'] += len(values) - len(present)
+    if len(present) == 0:
+        return
+
+    # HyperLogLog: the first bits of the hash select a register, which keeps the
+    # highest rank (position of the first 1 bit) seen among the remaining bits.
+    try:
+        hashes = pd.util.hash_pandas_object(present, index=False).to_numpy()
+    except TypeError:
+        # Unhashable values (e.g. lists or dicts) are counted by their string representation
+        hashes = pd.util.hash_pandas_object(present.astype(str), index=False).to_numpy()
+    remaining_bits = 64 - precision
+    indexes = (hashes >> np.uint64(remaining_bits)).astype(np.intp)
+    ranks = (remaining_bits - _bit_length(hashes & np.uint64((1 << remaining_bits) - 1)) + 1).astype(np.uint8)
+    np.maximum.at(accumulator['registers'], indexes, ranks)
+
+    if accumulator['ordered']:
+        chunk_min, chunk_max = present.min(), present.max()
+        accumulator['min'] = chunk_min if accumulator['min'] is None else min(accumulator['min'], chunk_min)
+        accumulator['max'] = chunk_max if accumulator['max'] is None else max(accumulator['max'], chunk_max)
+
+    if accumulator['is_string']:
+        counts = np.bincount(present.astype(str).str.len().to_numpy(dtype=np.int64))
+        lengths = accumulator['lengths']
+        if len(counts) > len(lengths):
+            lengths = np.pad(lengths, (0, len(counts) - len(lengths)))
+        lengths[:len(counts)] += counts
+        accumulator['lengths'] = lengths
+
+
+def _bit_length(values):
+    """
+    Computes the number of bits needed to represent each value of a uint64 array.
+
+    Args:
+        values (numpy.ndarray): The uint64 values.
+
+    Returns:
+        numpy.ndarray: The bit length of each value (0 for 0).
+    """
+    # Each 32-bit half is exactly representable as a float, so frexp's exponent is exact
+    high = np.frexp((values >> np.uint64(32)).astype(np.float64))[1]
+    low = np.frexp((values & np.uint64(0xFFFFFFFF)).astype(np.float64))[1]
+    return np.where(high > 0, high + 32, low)
+
+
+def _finish_accumulator(accumulator, count):
+    """
+    Builds the profile of a column from its running statistics.
+
+    Args:
+        accumulator (dict): The running statistics of the column.
+        count (int): The number of rows of the DataFrame.
+
+    Returns:
+        dict: The profile of the column.
+    """
+    registers = accumulator['registers']
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    distinct = alpha * m * m / np.sum(np.ldexp(1.0, -registers.astype(np.int64)))
+    zeros = np.count_nonzero(registers == 0)
+    if distinct <= 2.5 * m and zeros > 0:
+        distinct = m * np.log(m / zeros)  # Linear counting for small cardinalities
+
+    lengths = np.flatnonzero(accumulator['lengths'])
+    is_string = accumulator['is_string']
+
+    return {
+        'dtype': str(accumulator['dtype']),
+        'numeric': accumulator['numeric'],
+        'count': count,
+        'null_count': accumulator['null_count'],
+        'null_rate': accumulator['null_count'] / count if count > 0 else 0.0,
+        'all_null': accumulator['null_count'] == count,
+        'distinct': int(round(distinct)),
+        'min': accumulator['min'],
+        'max': accumulator['max'],
+        'min_length': int(lengths[0]) if is_string and len(lengths) > 0 else None,
+        'max_length': int(lengths[-1]) if is_string and len(lengths) > 0 else None,
+        'length_histogram': {int(length): int(accumulator['lengths'][length]) for length in lengths}
+        if is_string else None
+    }
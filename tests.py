@@ -1,12 +1,12 @@
-from lib.encryption import *
-from lib.generalization import *
-from lib.hashing import *
-from lib.masking import *
-from lib.null_out import *
-from lib.perturbation import *
-from lib.pseudonymization import *
-from lib.swapping import *
-from utils.data_processing import *
+from anonymizer_lib.lib.encryption import *
+from anonymizer_lib.lib.generalization import *
+from anonymizer_lib.lib.hashing import *
+from anonymizer_lib.lib.masking import *
+from anonymizer_lib.lib.null_out import *
+from anonymizer_lib.lib.perturbation import *
+from anonymizer_lib.lib.pseudonymization import *
+from anonymizer_lib.lib.swapping import *
+from anonymizer_lib.utils.data_processing import *
 import threading
 
 #dados iniciais
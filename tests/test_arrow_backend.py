@@ -0,0 +1,58 @@
+import datetime
+import threading
+
+import pyarrow as pa
+import pytest
+
+from anonymizer_lib.lib import arrow_backend, hashing
+from anonymizer_lib.lib.generalization import age_generalize_func
+from anonymizer_lib.utils.arrow_io import csv_to_table
+from anonymizer_lib.utils.data_processing import csv_to_dataframe
+
+
+@pytest.mark.parametrize('column_type', [
+    pa.date32(), pa.timestamp('s'), pa.timestamp('us'), pa.timestamp('ns'), pa.timestamp('ms', tz='UTC')
+])
+def test_perturb_date_keeps_column_type(column_type):
+    dates = pa.array([datetime.datetime(2001, 1, 1), None, datetime.datetime(2002, 6, 15)]).cast(column_type)
+    table = pa.table({'data': dates})
+
+    result = arrow_backend.perturb_date(table, ['data'], 'days', -10, 10, threading.Semaphore())
+
+    assert result.schema.field('data').type == column_type
+    assert result['data'].null_count == 1
+    for original, perturbed in zip(dates.to_pylist(), result['data'].to_pylist()):
+        if original is not None:
+            assert abs(perturbed - original) <= datetime.timedelta(days=10)
+
+
+def test_generalization_keeps_nulls():
+    table = pa.table({'idade': pa.array([10, None, 20])})
+
+    result = arrow_backend.generalization(table, ['idade'], age_generalize_func, threading.Semaphore())
+
+    assert result['idade'].to_pylist() == ['Young', None, 'Adult']
+
+
+def test_mask_last_n_characters():
+    table = pa.table({'nome': ['João', 'Mariam', 'Al', None]})
+    semaphore = threading.Semaphore()
+
+    assert arrow_backend.mask_last_n_characters(table, ['nome'], 0, semaphore).equals(table)
+    assert arrow_backend.mask_last_n_characters(table, ['nome'], 2, semaphore)['nome'].to_pylist() == [
+        'Jo**', 'Mari**', 'Al', None
+    ]
+
+
+@pytest.mark.parametrize('hash_name', ['apply_md5', 'apply_sha1', 'apply_sha256'])
+def test_hashes_match_pandas_backend(tmp_path, hash_name):
+    csv_file = tmp_path / 'dados.csv'
+    csv_file.write_text('nome,sobrenome\nJoão,Mitchard\nMariam,\nPedro,Gambles\n', encoding='utf-8')
+    semaphore = threading.Semaphore()
+
+    df = csv_to_dataframe(csv_file)
+    getattr(hashing, hash_name)(df, ['nome', 'sobrenome'], semaphore)
+    table = getattr(arrow_backend, hash_name)(csv_to_table(csv_file), ['nome', 'sobrenome'], semaphore)
+
+    for column in ['nome', 'sobrenome']:
+        assert table[column].to_pylist() == df[column].tolist()
@@ -0,0 +1,48 @@
+import hashlib
+import json
+
+import pandas as pd
+import pytest
+
+from anonymizer_lib.cli import main
+
+
+def write_job(tmp_path, backend, operations):
+    input_file = tmp_path / 'dados.csv'
+    input_file.write_text('nome,sobrenome\nJoão,Mitchard\nPedro,Gambles\n', encoding='utf-8')
+    spec_file = tmp_path / 'job.json'
+    spec_file.write_text(json.dumps({
+        'input': str(input_file),
+        'output': str(tmp_path / 'saida.csv'),
+        'backend': backend,
+        'operations': operations
+    }))
+    return spec_file
+
+
+def test_pandas_job_runs_pandas_only_operations(tmp_path):
+    spec_file = write_job(tmp_path, 'pandas', [
+        {'operation': 'pseudonymize_columns', 'args': [['nome']]},
+        {'operation': 'encrypt_aes', 'args': ['sobrenome', 'chave']}
+    ])
+
+    main([str(spec_file)])
+
+    result = pd.read_csv(tmp_path / 'saida.csv')
+    assert result['nome'].tolist() == [f"nome_{hashlib.md5(nome.encode()).hexdigest()}" for nome in ['João', 'Pedro']]
+
+
+def test_arrow_job_rejects_pandas_only_operations(tmp_path):
+    spec_file = write_job(tmp_path, 'arrow', [{'operation': 'pseudonymize_columns', 'args': [['nome']]}])
+
+    with pytest.raises(ValueError, match='arrow'):
+        main([str(spec_file)])
+
+
+def test_arrow_job(tmp_path):
+    spec_file = write_job(tmp_path, 'arrow', [{'operation': 'apply_md5', 'args': [['nome']]}])
+
+    main([str(spec_file)])
+
+    result = pd.read_csv(tmp_path / 'saida.csv')
+    assert result['nome'].tolist() == [hashlib.md5(nome.encode()).hexdigest() for nome in ['João', 'Pedro']]
@@ -0,0 +1,52 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import-time budget of the package and of the command line entry point (see README)
+IMPORT_TIME_BUDGETS = {
+    'anonymizer_lib': 0.010,
+    'anonymizer_lib.cli': 0.050
+}
+
+HEAVY_MODULES = ['pandas', 'numpy', 'pyarrow', 'Crypto']
+
+
+def run_python(code):
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True,
+        env={**os.environ, 'PYTHONPATH': ROOT}
+    )
+    return result.stdout
+
+
+@pytest.mark.parametrize('module', list(IMPORT_TIME_BUDGETS))
+def test_import_does_not_load_heavy_modules(module):
+    loaded = json.loads(run_python(
+        f"import json, sys, {module}; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    ))
+    assert loaded == []
+
+
+@pytest.mark.parametrize('module, budget', list(IMPORT_TIME_BUDGETS.items()))
+def test_import_time_budget(module, budget):
+    # Best of several runs, so a busy machine does not make the check flaky
+    timings = [
+        float(run_python(
+            f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+        ))
+        for _ in range(5)
+    ]
+    assert min(timings) < budget
+
+
+def test_submodules_load_on_first_use():
+    loaded = json.loads(run_python(
+        "import json, sys, anonymizer_lib; anonymizer_lib.apply_md5; before = 'Crypto' in sys.modules; "
+        "anonymizer_lib.encrypt_aes; print(json.dumps([before, 'Crypto' in sys.modules]))"
+    ))
+    assert loaded == [False, True]
@@ -0,0 +1,63 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from anonymizer_lib.lib.encryption import encrypt_aes, encrypt_chacha20
+from anonymizer_lib.lib.hashing import apply_sha256
+from anonymizer_lib.lib.pseudonymization import pseudonymize_columns
+from anonymizer_lib.lib.swapping import swap_columns
+from anonymizer_lib.utils.parallel_processing import run_partitioned
+
+
+def make_df(index=None):
+    n = 101
+    df = pd.DataFrame({
+        'nome': pd.Series([f'nome{i}' if i % 7 else None for i in range(n)], dtype=object),
+        'email': pd.Series([f'x{i}@gmail.com' if i % 5 else np.nan for i in range(n)], dtype=object),
+        'idade': np.arange(n),
+        'data': pd.date_range('2000-01-01', periods=n),
+        'misto': pd.Series([i if i % 3 else 'x' for i in range(n)], dtype=object),
+        'anulavel': pd.Series([i if i > 2 else None for i in range(n)], dtype='Int64'),
+        'booleano': pd.Series([bool(i % 2) if i > 2 else None for i in range(n)], dtype='boolean')
+    })
+    if index is not None:
+        df.index = index
+    return df
+
+
+def run_serial(df, func, args):
+    result = func(df, *args, threading.Semaphore())
+    return df if result is None else result
+
+
+@pytest.mark.parametrize('index', [None, pd.RangeIndex(10, 10 + 2 * 101, 2), pd.Index([f'r{i}' for i in range(101)])])
+@pytest.mark.parametrize('func, args', [
+    (apply_sha256, (['nome', 'email', 'idade', 'misto'],)),
+    (apply_sha256, (['anulavel', 'booleano'],)),
+    (pseudonymize_columns, (['nome', 'data'],))
+])
+def test_run_partitioned_matches_serial(index, func, args):
+    expected = run_serial(make_df(index), func, args)
+    result = run_partitioned(make_df(index), func, args, n_partitions=4, max_workers=2)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('encrypt', [True, False])
+def test_run_partitioned_keeps_bytes_values(encrypt):
+    df = make_df()[['idade']].astype(str).astype(object)
+    if encrypt:
+        encrypt_aes(df, 'idade', 'chave', threading.Semaphore())
+    else:
+        df['idade'] = df['idade'].str.encode('utf-8')
+
+    expected = run_serial(df.copy(), apply_sha256, (['idade'],))
+    result = run_partitioned(df, apply_sha256, (['idade'],), n_partitions=3, max_workers=2)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('func', [swap_columns, encrypt_chacha20])
+def test_run_partitioned_rejects_non_partitionable_operations(func):
+    with pytest.raises(ValueError):
+        run_partitioned(make_df(), func, (['nome'],))
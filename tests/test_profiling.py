@@ -0,0 +1,91 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from anonymizer_lib.lib.masking import mask_full
+from anonymizer_lib.utils.data_processing import check_columns
+from anonymizer_lib.utils.profiling import profile_columns
+
+
+def make_df():
+    rng = np.random.default_rng(0)
+    n = 50000
+    return pd.DataFrame({
+        'inteiro': rng.integers(0, 20000, n),
+        'real': rng.random(n),
+        'texto': pd.Series([f'v{i % 3000}' if i % 9 else None for i in range(n)], dtype=object),
+        'data': pd.date_range('2000-01-01', periods=n, freq='min'),
+        'nulo': pd.Series([None] * n, dtype=object)
+    })
+
+
+def by_name(profile):
+    return {column_profile['column']: column_profile for column_profile in profile}
+
+
+@pytest.mark.parametrize('column', ['inteiro', 'real', 'texto', 'data'])
+def test_distinct_is_close_to_nunique(column):
+    df = make_df()
+    profile = by_name(profile_columns(df, threading.Semaphore()))
+
+    assert profile[column]['distinct'] == pytest.approx(df[column].nunique(), rel=0.05)
+
+
+def test_chunks_are_merged():
+    df = make_df()
+    semaphore = threading.Semaphore()
+    chunked = profile_columns(df, semaphore, chunk_size=777)
+    whole = profile_columns(df, semaphore, chunk_size=len(df))
+
+    assert chunked == whole
+    chunked = by_name(chunked)
+    assert chunked['inteiro']['min'] == df['inteiro'].min()
+    assert chunked['inteiro']['max'] == df['inteiro'].max()
+    assert chunked['data']['max'] == df['data'].max()
+    lengths = df['texto'].dropna().str.len().value_counts()
+    assert chunked['texto']['length_histogram'] == {int(length): int(count) for length, count in lengths.items()}
+    assert (chunked['texto']['min_length'], chunked['texto']['max_length']) == (lengths.index.min(), lengths.index.max())
+
+
+def test_null_statistics():
+    df = make_df()
+    profile = by_name(profile_columns(df, threading.Semaphore()))
+
+    assert profile['nulo']['all_null']
+    assert profile['nulo']['null_rate'] == 1.0
+    assert not profile['texto']['all_null']
+    assert profile['texto']['null_count'] == df['texto'].isna().sum()
+
+
+def test_unhashable_values():
+    df = pd.DataFrame({'lista': [[1, 2], [1, 2], [3], None], 'mapa': [{'a': 1}, {'b': 2}, None, None]})
+    profile = by_name(profile_columns(df, threading.Semaphore()))
+
+    assert profile['lista']['distinct'] == 2
+    assert profile['mapa']['null_count'] == 2
+    check_columns(df, threading.Semaphore())
+
+
+def test_check_columns_sees_values_changed_in_place():
+    semaphore = threading.Semaphore()
+    df = pd.DataFrame({'a': ['x', 'y'], 'b': pd.Series([None, None], dtype=object)})
+
+    with pytest.raises(ValueError):
+        check_columns(df, semaphore)
+    mask_full(df, ['b'], semaphore)
+    check_columns(df, semaphore)
+
+    df['a'] = pd.Series([None, None], dtype=object)
+    with pytest.raises(ValueError):
+        check_columns(df, semaphore)
+
+
+def test_duplicate_column_names():
+    semaphore = threading.Semaphore()
+    df = pd.DataFrame([[None, 1], [None, 2]], columns=['a', 'a'])
+
+    assert [column_profile['all_null'] for column_profile in profile_columns(df, semaphore)] == [True, False]
+    with pytest.raises(ValueError):
+        check_columns(df, semaphore)